@@ -710,13 +710,14 @@ def _verify_sample_shape(xx: np.ndarray, num_cols: int):
     Raises
     ------
     ValueError
-        If the number of columns in the input is not equal to the expected
-        number of columns.
+        If the input is not a two-dimensional array or if the number of columns
+        in the input is not equal to the expected number of columns.
     """
-    if xx.shape[1] != num_cols:
+    shape = xx.shape
+    if len(shape) != 2 or shape[1] != num_cols:
         raise ValueError(
-            f"Wrong dimensionality of the input array!"
-            f"Expected {num_cols}, got {xx.shape[1]}."
+            f"Wrong dimensionality of the input array! "
+            f"Expected (N, {num_cols}), got {shape}."
         )
 
 
@@ -65,6 +65,11 @@ import numpy as np
 
 from uqtestfuns.core.custom_typing import ProbInputSpecs, FunParamSpecs
 from uqtestfuns.core.uqtestfun_abc import UQTestFunVarDimABC
+from .utils import (
+    MIN_ROWS_COLUMN_LOOP,
+    cache_read_only,
+    evaluate_by_blocks,
+)
 
 __all__ = ["SobolG"]
 
@@ -90,7 +95,10 @@ AVAILABLE_INPUTS: ProbInputSpecs = {
 
 DEFAULT_INPUT_SELECTION = "Saltelli1995"
 
+AA_SUN2022 = np.array([0.0, 1.0, 4.5, 9.0, 99.0, 99.0, 99.0])
 
+
+@cache_read_only
 def _get_params_saltelli_1995_1(input_dimension: int) -> np.ndarray:
     """Construct a parameter array for Sobol'-G according to example 1 in [4].
 
@@ -105,6 +113,7 @@ def _get_params_saltelli_1995_1(input_dimension: int) -> np.ndarray:
     return yy
 
 
+@cache_read_only
 def _get_params_saltelli_1995_2(input_dimension: int) -> np.ndarray:
     """Construct a parameter array for Sobol'-G according to example 2 in [4].
 
@@ -116,19 +125,13 @@ def _get_params_saltelli_1995_2(input_dimension: int) -> np.ndarray:
       are used then the remaining dimension is also non-influential.
     """
     yy = np.zeros(input_dimension)
-
-    if input_dimension > 1:
-        yy[1] = 0
-
-    if input_dimension > 2:
-        yy[2] = 3
-
-    if input_dimension > 3:
-        yy[3:] = 9
+    yy[2:3] = 3.0
+    yy[3:] = 9.0
 
     return yy
 
 
+@cache_read_only
 def _get_params_saltelli_1995_3(input_dimension: int) -> np.ndarray:
     """Construct a parameter array for Sobol'-G according to example 3 in [4].
 
@@ -140,11 +143,12 @@ def _get_params_saltelli_1995_3(input_dimension: int) -> np.ndarray:
       are used then the remaining dimension is also non-influential.
     - The parameter set is also used in [8].
     """
-    yy = (np.arange(1, input_dimension + 1) - 1) / 2.0
+    yy = 0.5 * np.arange(input_dimension, dtype=np.float64)
 
     return yy
 
 
+@cache_read_only
 def _get_params_sobol_1998_1(input_dimension: int) -> np.ndarray:
     """Construct a parameter array for Sobol'-G according to choice 1 in [3].
 
@@ -153,11 +157,12 @@ def _get_params_sobol_1998_1(input_dimension: int) -> np.ndarray:
     - Using this choice of parameters, the supremum of the Sobol-G function
       grows exponentially as a function of dimension about 2^M.
     """
-    yy = 0.01 * np.ones(input_dimension)
+    yy = np.full(input_dimension, 0.01)
 
     return yy
 
 
+@cache_read_only
 def _get_params_sobol_1998_2(input_dimension: int) -> np.ndarray:
     """Construct a parameter array for Sobol'-G according to choice 2 in [3].
 
@@ -172,6 +177,7 @@ def _get_params_sobol_1998_2(input_dimension: int) -> np.ndarray:
     return yy
 
 
+@cache_read_only
 def _get_params_sobol_1998_3(input_dimension: int) -> np.ndarray:
     """Construct a parameter array for Sobol'-G according to choice 3 in [3].
 
@@ -180,11 +186,12 @@ def _get_params_sobol_1998_3(input_dimension: int) -> np.ndarray:
     - Using this choice of parameters, the supremum of the Sobol-G function
       grows linearly as a function of dimension, i.e., 1 + (M/2).
     """
-    yy = np.arange(1, input_dimension + 1)
+    yy = np.arange(1, input_dimension + 1, dtype=np.float64)
 
     return yy
 
 
+@cache_read_only
 def _get_params_sobol_1998_4(input_dimension: int) -> np.ndarray:
     """Construct a parameter array for Sobol-G according to choice 4 in [3].
 
@@ -193,11 +200,12 @@ def _get_params_sobol_1998_4(input_dimension: int) -> np.ndarray:
     - Using this choice of parameters, the supremum of the Sobol-G function
       is bounded at 1.0.
     """
-    yy = np.arange(1, input_dimension + 1) ** 2
+    yy = np.arange(1, input_dimension + 1, dtype=np.float64) ** 2
 
     return yy
 
 
+@cache_read_only
 def _get_params_kucherenko_2011_2a(input_dimension: int) -> np.ndarray:
     """Construct a param. array for Sobol'-G according to problem 2A in [7]."""
     yy = np.zeros(input_dimension)
@@ -207,6 +215,7 @@ def _get_params_kucherenko_2011_2a(input_dimension: int) -> np.ndarray:
     return yy
 
 
+@cache_read_only
 def _get_params_kucherenko_2011_3b(input_dimension: int) -> np.ndarray:
     """Construct a parameter array for Sobol'-G according to problem 3B in [7].
 
@@ -215,11 +224,12 @@ def _get_params_kucherenko_2011_3b(input_dimension: int) -> np.ndarray:
     - Using this choice of parameters, the supremum of the Sobol-G function
       grows exponentially as a function of dimension about (1.13)^M.
     """
-    yy = 6.52 * np.ones(input_dimension)
+    yy = np.full(input_dimension, 6.52)
 
     return yy
 
 
+@cache_read_only
 def _get_params_sun_2022(input_dimension: int) -> np.ndarray:
     """Construct a parameter array for Sobol'-G according to Sec. 3. 2. [9].
 
@@ -230,13 +240,13 @@ def _get_params_sun_2022(input_dimension: int) -> np.ndarray:
       then the remaining coefficients are extrapolated
       from the last available value.
     """
-    aa = np.array([0.0, 1.0, 4.5, 9.0, 99, 99, 99])
+    aa = np.empty(input_dimension)
 
-    if input_dimension > len(aa):
-        aa_ext = 99 * np.ones(input_dimension - len(aa))
-        aa = np.append(aa, aa_ext)
+    num_base = min(input_dimension, len(AA_SUN2022))
+    aa[:num_base] = AA_SUN2022[:num_base]
+    aa[num_base:] = 99.0
 
-    return aa[:input_dimension]
+    return aa
 
 
 AVAILABLE_PARAMETERS: FunParamSpecs = {
@@ -419,12 +429,108 @@ def evaluate(xx: np.ndarray, aa: np.ndarray):
     np.ndarray
         The output of the Sobol-G function evaluated on the input values.
         The output is a 1-dimensional array of length N.
+
+    Notes
+    -----
+    - If the input values are given in single precision (``np.float32``),
+      the function is evaluated and returned in single precision as well.
+      This halves the memory traffic for large Monte-Carlo samples.
+    - If the supremum of the function for the given parameters exceeds
+      the range of single precision (e.g., "Sobol1998-1" in high dimension),
+      the function is evaluated and returned in double precision instead.
     """
-    yy = np.prod(((np.abs(4 * xx - 2) + aa) / (1 + aa)), axis=1)
+    if xx.dtype == np.float32:
+        if np.prod((2 + aa) / (1 + aa)) < np.finfo(np.float32).max:
+            aa = aa.astype(np.float32, copy=False)
+        else:
+            xx = xx.astype(np.float64)
+
+    inv_aa = 1 / (1 + aa)
+    if xx.shape[0] < MIN_ROWS_COLUMN_LOOP:
+        yy = _evaluate_vectorized(xx, aa, inv_aa)
+    else:
+        yy = evaluate_by_blocks(_evaluate_block, xx, aa, inv_aa)
 
     return yy
 
 
+def _evaluate_vectorized(
+    xx: np.ndarray,
+    aa: np.ndarray,
+    inv_aa: np.ndarray,
+) -> np.ndarray:
+    """Evaluate the Sobol-G function on a few input values at once."""
+    # (|4x - 2| + a) / (1 + a) = |x - 0.5| * 4 / (1 + a) + a / (1 + a)
+    tt = np.subtract(xx, 0.5)
+    np.fabs(tt, out=tt)
+    np.multiply(tt, 4 * inv_aa, out=tt)
+    np.add(tt, aa * inv_aa, out=tt)
+
+    return np.prod(tt, axis=-1)
+
+
+def _evaluate_block(
+    xx: np.ndarray,
+    aa: np.ndarray,
+    inv_aa: np.ndarray,
+) -> np.ndarray:
+    """Evaluate the Sobol-G function on a block of input values."""
+    # Accumulate the product one input dimension (column) at a time;
+    # only two arrays of length N are allocated regardless of M.
+    # Strided column reads are cheaper than a layout conversion of the input.
+    dtype = np.result_type(xx.dtype, aa.dtype)
+    yy = np.ones_like(xx[:, 0], dtype=dtype)
+    tt = np.empty_like(yy)
+    for j in range(xx.shape[1]):
+        # (|4x - 2| + a) / (1 + a) = |x - 0.5| * 4 / (1 + a) + a / (1 + a)
+        np.subtract(xx[:, j], 0.5, out=tt)
+        np.fabs(tt, out=tt)
+        np.multiply(tt, 4 * inv_aa[j], out=tt)
+        # Zero coefficients (e.g., "Saltelli1995-1") reduce the term to |4x-2|
+        if aa[j] != 0:
+            np.add(tt, aa[j] * inv_aa[j], out=tt)
+        np.multiply(yy, tt, out=yy)
+
+    return yy
+
+
+def evaluate_batch(xxs: np.ndarray, aa: np.ndarray) -> np.ndarray:
+    """Evaluate the Sobol-G function on a batch of sets of input values.
+
+    Parameters
+    ----------
+    xxs : np.ndarray
+        K sets of M-Dimensional input values given by a K-by-N-by-M array
+        where N is the number of input values in each set. For instance,
+        the matrices A, B, and AB_i of the Saltelli's sampling scheme
+        for estimating the Sobol' indices stacked together.
+    aa : np.ndarray
+        The vector of parameters (i.e., coefficients) of the Sobol'-G function;
+        the length of the vector is the same as the number of input dimensions.
+
+    Returns
+    -------
+    np.ndarray
+        The output of the Sobol-G function evaluated on the input values.
+        The output is a 2-dimensional array of shape K-by-N.
+
+    Notes
+    -----
+    - All the K sets are evaluated in a single vectorized call instead of K
+      separate calls to `evaluate()`.
+    """
+    if xxs.ndim != 3:
+        raise ValueError(
+            f"Expected a 3-dimensional array of input values! "
+            f"Got instead {xxs.ndim} dimension(s)."
+        )
+
+    num_sets, num_samples, input_dim = xxs.shape
+    yys = evaluate(xxs.reshape(num_sets * num_samples, input_dim), aa)
+
+    return yys.reshape(num_sets, num_samples)
+
+
 class SobolG(UQTestFunVarDimABC):
     """An implementation of the M-dimensional Sobol'-G test function."""
 
@@ -435,3 +541,4 @@ class SobolG(UQTestFunVarDimABC):
     _default_parameters_id = DEFAULT_PARAMETERS_SELECTION
 
     evaluate = staticmethod(evaluate)  # type: ignore
+    evaluate_batch = staticmethod(evaluate_batch)
@@ -36,6 +36,11 @@ import numpy as np
 
 from uqtestfuns.core.custom_typing import ProbInputSpecs, FunParamSpecs
 from uqtestfuns.core.uqtestfun_abc import UQTestFunVarDimABC
+from .utils import (
+    MIN_ROWS_COLUMN_LOOP,
+    cache_read_only,
+    evaluate_by_blocks,
+)
 
 __all__ = ["SobolGStar"]
 
@@ -59,7 +64,15 @@ AVAILABLE_INPUTS: ProbInputSpecs = {
     },
 }
 
+AA_SALTELLI2010_B = np.array(
+    [0.0, 0.1, 0.2, 0.3, 0.4, 0.8, 1.0, 2.0, 3.0, 4.0]
+)
 
+# A single generator shared across instances for the random shift parameter
+RNG_DELTA = np.random.default_rng()
+
+
+@cache_read_only
 def _get_aa_saltelli_2010_a(input_dimension: int) -> np.ndarray:
     """Construct a coefficients array for the Sobol'-G* function from [1].
 
@@ -77,6 +90,7 @@ def _get_aa_saltelli_2010_a(input_dimension: int) -> np.ndarray:
     return aa
 
 
+@cache_read_only
 def _get_aa_saltelli_2010_b(input_dimension: int) -> np.ndarray:
     """Construct a coefficients array for the Sobol'-G* function from [1].
 
@@ -87,15 +101,16 @@ def _get_aa_saltelli_2010_b(input_dimension: int) -> np.ndarray:
       than 10, the parameters array is truncated; if the input dimension exceed
       10, the parameters are is extrapolated.
     """
-    aa = np.array([0.0, 0.1, 0.2, 0.3, 0.4, 0.8, 1, 2, 3, 4])
+    aa = np.empty(input_dimension)
 
-    if input_dimension > 10:
-        aa_ext = np.arange(5, input_dimension - 5)
-        aa = np.append(aa, aa_ext)
+    num_base = min(input_dimension, len(AA_SALTELLI2010_B))
+    aa[:num_base] = AA_SALTELLI2010_B[:num_base]
+    aa[num_base:] = np.arange(5, 5 + input_dimension - num_base)
 
-    return aa[:input_dimension]
+    return aa
 
 
+@cache_read_only
 def _get_alpha_saltelli_2010_a(input_dimension: int) -> np.ndarray:
     """Construct an alpha array for the Sobol'-G* function from [1].
 
@@ -111,6 +126,7 @@ def _get_alpha_saltelli_2010_a(input_dimension: int) -> np.ndarray:
     return alpha
 
 
+@cache_read_only
 def _get_alpha_saltelli_2010_b(input_dimension: int) -> np.ndarray:
     """Construct an alpha array for the Sobol'-G* function from [1].
 
@@ -126,6 +142,7 @@ def _get_alpha_saltelli_2010_b(input_dimension: int) -> np.ndarray:
     return alpha
 
 
+@cache_read_only
 def _get_alpha_saltelli_2010_c(input_dimension: int) -> np.ndarray:
     """Construct an alpha array for the Sobol'-G* function from [1].
 
@@ -147,8 +164,7 @@ def _get_delta_saltelli_2010(input_dimension: int) -> np.ndarray:
     The parameter delta (shift parameter) is randomly generated
     from a uniform distribution in [0, 1].
     """
-    rng = np.random.default_rng()
-    delta = rng.random(input_dimension)
+    delta = RNG_DELTA.random(input_dimension)
 
     return delta
 
@@ -350,15 +366,163 @@ def evaluate(
     np.ndarray
         The output of the test function evaluated on the input values.
         The output is a 1-dimensional array of length N.
+
+    Notes
+    -----
+    - If the input values are given in single precision (``np.float32``),
+      the function is evaluated and returned in single precision as well
+      (see `evaluate_parameter_sets()`).
     """
-    term = np.abs(2 * (xx + delta - np.floor(xx + delta)) - 1) ** alpha
-    g_star = ((1 + alpha) * term + aa) / (1 + aa)
+    yy = evaluate_parameter_sets(xx, aa, delta, alpha)[0]
+
+    return yy
+
+
+def evaluate_parameter_sets(
+    xx: np.ndarray,
+    aa: np.ndarray,
+    delta: np.ndarray,
+    alpha: np.ndarray,
+) -> np.ndarray:
+    """Evaluate the modified Sobol-G function for several parameter sets.
+
+    Parameters
+    ----------
+    xx : np.ndarray
+        M-Dimensional input values given by an N-by-M array where
+        N is the number of input values.
+    aa : np.ndarray
+        K sets of coefficients of the modified Sobol'-G function given
+        by a K-by-M array (or a vector of length M for a single set).
+    delta: np.ndarray
+        The vector of shift parameters of length M shared by all the sets.
+    alpha: np.ndarray
+        K sets of curvature parameters given by a K-by-M array
+        (or a vector of length M for a single set).
+
+    Returns
+    -------
+    np.ndarray
+        The output of the test function evaluated on the input values.
+        The output is a 2-dimensional array of shape K-by-N.
 
-    yy = np.prod(g_star, axis=1)
+    Notes
+    -----
+    - If the input values are given in single precision (``np.float32``),
+      the function is evaluated and returned in single precision as well,
+      unless the supremum of the function exceeds the range of
+      single precision.
+    - The shifted periodic transform of the input values, which only depends
+      on the shift parameters, is computed once and shared by all the sets
+      (e.g., test cases 1 to 6 of [1] with the same shift parameters).
+    """
+    aa = np.atleast_2d(aa)
+    alpha = np.atleast_2d(alpha)
+    if aa.shape != alpha.shape:
+        raise ValueError(
+            f"The coefficients {aa.shape} and the curvature parameters "
+            f"{alpha.shape} must have the same shape!"
+        )
+
+    # Single precision input is evaluated in single precision,
+    # unless the supremum of the function may overflow
+    dtype: np.dtype = np.dtype(np.float64)
+    if xx.dtype == np.float32:
+        sup = np.prod((1 + alpha + aa) / (1 + aa), axis=1)
+        if np.all(sup < np.finfo(np.float32).max):
+            dtype = np.dtype(np.float32)
+
+    args = (aa, delta, alpha, 1 / (1 + aa), 1 + alpha, dtype)
+    if xx.shape[0] < MIN_ROWS_COLUMN_LOOP:
+        yy = _evaluate_vectorized(xx, *args)
+    else:
+        yy = np.ascontiguousarray(
+            evaluate_by_blocks(_evaluate_block, xx, *args).T
+        )
 
     return yy
 
 
+def _evaluate_vectorized(
+    xx: np.ndarray,
+    aa: np.ndarray,
+    delta: np.ndarray,
+    alpha: np.ndarray,
+    inv_aa: np.ndarray,
+    one_plus_alpha: np.ndarray,
+    dtype: np.dtype,
+) -> np.ndarray:
+    """Evaluate the Sobol-G* function for K sets on a few input values at once.
+
+    The output is a K-by-N array (one row per parameter set).
+    """
+    # |2 * frac(x + delta) - 1|, shared by all the parameter sets
+    shifted = np.add(xx, delta, dtype=dtype)
+    shifted -= np.floor(shifted)
+    shifted *= 2
+    shifted -= 1
+    np.fabs(shifted, out=shifted)
+
+    # K-by-N-by-M terms, one N-by-M slice per parameter set
+    tt = np.power(shifted, alpha[:, np.newaxis, :], dtype=dtype)
+    tt *= one_plus_alpha[:, np.newaxis, :]
+    tt += aa[:, np.newaxis, :]
+    tt *= inv_aa[:, np.newaxis, :]
+
+    return np.prod(tt, axis=-1)
+
+
+def _evaluate_block(
+    xx: np.ndarray,
+    aa: np.ndarray,
+    delta: np.ndarray,
+    alpha: np.ndarray,
+    inv_aa: np.ndarray,
+    one_plus_alpha: np.ndarray,
+    dtype: np.dtype,
+) -> np.ndarray:
+    """Evaluate the Sobol-G* function for K sets on a block of input values.
+
+    The output is an N-by-K array (one column per parameter set).
+    """
+    num_sets = aa.shape[0]
+    num_samples, input_dim = xx.shape
+
+    # Accumulate the product one input dimension (column) at a time;
+    # only a few arrays of length N are allocated regardless of M
+    yy = np.ones((num_sets, num_samples), dtype=dtype)
+    shifted = np.empty(num_samples, dtype=dtype)
+    term = np.empty(num_samples, dtype=dtype)
+    for j in range(input_dim):
+        # |2 * frac(x + delta) - 1|, shared by all the parameter sets;
+        # the full reduction keeps any value of delta valid
+        # (the term buffer holds the floor until it is used below)
+        np.add(xx[:, j], delta[j], out=shifted)
+        np.floor(shifted, out=term)
+        np.subtract(shifted, term, out=shifted)
+        np.multiply(shifted, 2, out=shifted)
+        np.subtract(shifted, 1, out=shifted)
+        np.fabs(shifted, out=shifted)
+
+        for k in range(num_sets):
+            # Avoid the generic power function for the curvatures used in [1]
+            if alpha[k, j] == 0.5:
+                np.sqrt(shifted, out=term)
+            elif alpha[k, j] == 2.0:
+                np.multiply(shifted, shifted, out=term)
+            elif alpha[k, j] == 1.0:
+                np.copyto(term, shifted)
+            else:
+                np.power(shifted, alpha[k, j], out=term)
+
+            np.multiply(term, one_plus_alpha[k, j], out=term)
+            np.add(term, aa[k, j], out=term)
+            np.multiply(term, inv_aa[k, j], out=term)
+            np.multiply(yy[k], term, out=yy[k])
+
+    return yy.T
+
+
 class SobolGStar(UQTestFunVarDimABC):
     """An implementation of the M-dimensional Sobol'-G* test function."""
 
@@ -369,3 +533,4 @@ class SobolGStar(UQTestFunVarDimABC):
     _default_parameters_id = DEFAULT_PARAMETERS_SELECTION
 
     evaluate = staticmethod(evaluate)  # type: ignore
+    evaluate_parameter_sets = staticmethod(evaluate_parameter_sets)
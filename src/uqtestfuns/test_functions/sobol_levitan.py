@@ -32,6 +32,7 @@ import numpy as np
 
 from uqtestfuns.core.custom_typing import FunParamSpecs, ProbInputSpecs
 from uqtestfuns.core.uqtestfun_abc import UQTestFunVarDimABC
+from .utils import cache_read_only
 
 __all__ = ["SobolLevitan"]
 
@@ -55,7 +56,33 @@ AVAILABLE_INPUTS: ProbInputSpecs = {
     },
 }
 
-
+BB_MOON2012 = np.array(
+    [
+        2.0000,
+        1.9500,
+        1.9000,
+        1.8500,
+        1.8000,
+        1.7500,
+        1.7000,
+        1.6500,
+        0.4228,
+        0.3077,
+        0.2169,
+        0.1471,
+        0.0951,
+        0.0577,
+        0.0323,
+        0.0161,
+        0.0068,
+        0.0021,
+        0.0004,
+        0.0000,
+    ]
+)
+
+
+@cache_read_only
 def _get_bb_sobol_1999_1(input_dimension: int) -> np.ndarray:
     """Construct the coefficients from Sobol' and Levitan (1999) 6D case.
 
@@ -65,15 +92,13 @@ def _get_bb_sobol_1999_1(input_dimension: int) -> np.ndarray:
       than 6, the parameters array is truncated; if the input dimension exceed
       10, the parameters are is extrapolated.
     """
-    bb = np.array([1.5, 0.9, 0.9, 0.9, 0.9, 0.9])
-
-    if input_dimension > 6:
-        bb_ext = 0.9 * np.ones(input_dimension - len(bb))
-        bb = np.append(bb, bb_ext)
+    bb = np.full(input_dimension, 0.9)
+    bb[:1] = 1.5
 
-    return bb[:input_dimension]
+    return bb
 
 
+@cache_read_only
 def _get_bb_sobol_1999_2(input_dimension: int) -> np.ndarray:
     """Construct the coefficients from Sobol' and Levitan (1999) 20D case.
 
@@ -83,17 +108,13 @@ def _get_bb_sobol_1999_2(input_dimension: int) -> np.ndarray:
       than 20, the parameters array is truncated; if the input dimension exceed
       20, the parameters are is extrapolated.
     """
-    bb_1 = 0.6 * np.ones(10)
-    bb_2 = 0.4 * np.ones(10)
-    bb = np.append(bb_1, bb_2)
+    bb = np.full(input_dimension, 0.4)
+    bb[:10] = 0.6
 
-    if input_dimension > 20:
-        bb_ext = 0.4 * np.ones(input_dimension - len(bb))
-        bb = np.append(bb, bb_ext)
-
-    return bb[:input_dimension]
+    return bb
 
 
+@cache_read_only
 def _get_bb_moon_2012_1(input_dimension: int) -> np.ndarray:
     """Construct the coefficients from Moon et al. (2012) base case.
 
@@ -103,36 +124,12 @@ def _get_bb_moon_2012_1(input_dimension: int) -> np.ndarray:
       than 20, the parameters array is truncated; if the input dimension exceed
       20, the parameters are is extrapolated.
     """
-    bb = np.array(
-        [
-            2.0000,
-            1.9500,
-            1.9000,
-            1.8500,
-            1.8000,
-            1.7500,
-            1.7000,
-            1.6500,
-            0.4228,
-            0.3077,
-            0.2169,
-            0.1471,
-            0.0951,
-            0.0577,
-            0.0323,
-            0.0161,
-            0.0068,
-            0.0021,
-            0.0004,
-            0.0000,
-        ]
-    )
+    bb = np.zeros(input_dimension)
 
-    if input_dimension > 20:
-        bb_ext = np.zeros(input_dimension - len(bb))
-        bb = np.append(bb, bb_ext)
+    num_base = min(input_dimension, len(BB_MOON2012))
+    bb[:num_base] = BB_MOON2012[:num_base]
 
-    return bb[:input_dimension]
+    return bb
 
 
 AVAILABLE_PARAMETERS: FunParamSpecs = {
@@ -224,18 +221,35 @@ def evaluate(xx: np.ndarray, bb: np.ndarray, c0: float) -> np.ndarray:
     np.ndarray
         The output of the test function evaluated on the input values.
         The output is a 1-dimensional array of length N.
+
+    Notes
+    -----
+    - If the input values are given in single precision (``np.float32``),
+      the function is evaluated and returned in single precision as well,
+      unless the exponential term may exceed the range of single precision.
     """
-    input_dim = xx.shape[1]
-    ii = 1.0
-    for i in range(input_dim):
-        b = bb[i]
-        # Safeguard against zero-value coefficient
-        if b == 0:
-            ii *= 1.0  # the limit as b approaches 0
-        else:
-            ii *= (np.exp(b) - 1) / b
-
-    yy = np.exp(np.sum(bb * xx, axis=1)) - ii + c0
+    # expm1 avoids the cancellation in exp(b) - 1 for small coefficients;
+    # safeguard against zero-value coefficient (the limit as b -> 0 is 1.0)
+    ii_factors = np.divide(
+        np.expm1(bb), bb, out=np.ones(len(bb)), where=bb != 0
+    )
+    ii = np.prod(ii_factors)
+
+    # Trailing input variables with zero coefficients (e.g., "Moon2012-1"
+    # extrapolated to higher dimension) do not contribute; skip them (view)
+    num_active = np.flatnonzero(bb)[-1] + 1 if np.any(bb) else 0
+
+    # Single precision input is evaluated in single precision,
+    # unless the exponential term may overflow
+    bb = bb[:num_active]
+    if xx.dtype == np.float32:
+        if np.sum(np.maximum(bb, 0)) < np.log(np.finfo(np.float32).max):
+            bb = bb.astype(np.float32, copy=False)
+
+    # Matrix-vector product avoids an N-by-M temporary array
+    yy = xx[:, :num_active] @ bb
+    np.exp(yy, out=yy)
+    yy += c0 - ii
 
     return yy
 
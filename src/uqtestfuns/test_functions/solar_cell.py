@@ -16,8 +16,10 @@ References
 """
 
 import numpy as np
-from scipy.optimize import root, minimize
-from typing import Tuple
+import warnings
+
+from scipy.optimize import newton
+from typing import Optional, Tuple
 
 from uqtestfuns.core.custom_typing import (
     MarginalSpecs,
@@ -101,22 +103,23 @@ AVAILABLE_PARAMETERS: FunParamSpecs = {
 
 
 def obj_fun_root(
-    i: float,
-    v: float,
+    i: np.ndarray,
+    v: np.ndarray,
     x: np.ndarray,
     n_s: int,
     v_th: float,
-) -> float:
+) -> np.ndarray:
     """Compute the equation to get the root.
 
     Parameters
     ----------
-    i : float
-        The current [A]
-    v : float
-        The voltage [V]
+    i : np.ndarray
+        The current [A]; either a scalar or an array of length N.
+    v : np.ndarray
+        The voltage [V]; either a scalar or an array of length N.
     x : np.ndarray
-        The input variables of the solar cell model: I_SC, I_S, n, R_S, R_P.
+        The input variables of the solar cell model: I_SC, I_S, n, R_S, R_P;
+        either a single input value of length 5 or an N-by-5 array.
     n_s : int
         The number of cells connected in series.
     v_th : float
@@ -124,26 +127,137 @@ def obj_fun_root(
 
     Returns
     -------
-    float
+    np.ndarray
         The root objective function for implicit current; the function returns
         0 if the current corresponds to the given voltage.
     """
+    y, _ = obj_fun_root_and_prime(i, v, x, n_s, v_th)
+
+    return y
+
+
+def obj_fun_root_prime(
+    i: np.ndarray,
+    v: np.ndarray,
+    x: np.ndarray,
+    n_s: int,
+    v_th: float,
+) -> np.ndarray:
+    """Compute the derivative of the root equation w.r.t. the current.
+
+    Parameters
+    ----------
+    i : np.ndarray
+        The current [A]; either a scalar or an array of length N.
+    v : np.ndarray
+        The voltage [V]; either a scalar or an array of length N.
+    x : np.ndarray
+        The input variables of the solar cell model: I_SC, I_S, n, R_S, R_P;
+        either a single input value of length 5 or an N-by-5 array.
+    n_s : int
+        The number of cells connected in series.
+    v_th : float
+        The thermal voltage value at 25degC [V]
+
+    Returns
+    -------
+    np.ndarray
+        The derivative of the root objective function for implicit current
+        with respect to the current.
+    """
+    _, dy_di = obj_fun_root_and_prime(i, v, x, n_s, v_th)
+
+    return dy_di
+
+
+def obj_fun_root_and_prime(
+    i: np.ndarray,
+    v: np.ndarray,
+    x: np.ndarray,
+    n_s: int,
+    v_th: float,
+    i_l: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the root equation and its derivative w.r.t. the current.
+
+    Parameters
+    ----------
+    i : np.ndarray
+        The current [A]; either a scalar or an array of length N.
+    v : np.ndarray
+        The voltage [V]; either a scalar or an array of length N.
+    x : np.ndarray
+        The input variables of the solar cell model: I_SC, I_S, n, R_S, R_P;
+        either a single input value of length 5 or an N-by-5 array.
+    n_s : int
+        The number of cells connected in series.
+    v_th : float
+        The thermal voltage value at 25degC [V]
+    i_l : np.ndarray, optional
+        The photo current [A], which depends only on the input variables;
+        if not specified, it is computed from the input variables.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The root objective function for implicit current and its derivative
+        with respect to the current; both share the exponential term.
+    """
     # Get the input variable values
-    i_sc = x[0]
-    i_s = np.exp(x[1])
-    n = x[2]
-    r_s = x[3]
-    r_p = x[4]
+    i_s = np.exp(x[..., 1])
+    n = x[..., 2]
+    r_s = x[..., 3]
+    r_p = x[..., 4]
 
-    # Compute the photo current
-    exp_term_1 = np.exp(i_sc * r_s / n_s / n / v_th) - 1
-    i_l = i_sc + i_s * exp_term_1 + i_sc * r_s / r_p
+    if i_l is None:
+        i_l = compute_photo_current(x, n_s, v_th)
 
     # Compute the objective function
-    exp_term_2 = np.exp((v + i * r_s) / n_s / n / v_th) - 1
-    y = i - i_l + i_s * exp_term_2 + (v + i * r_s) / r_p
+    inv_n_vth = 1.0 / (n_s * n * v_th)
+    v_diode = v + i * r_s
+    exp_term_2 = np.expm1(v_diode * inv_n_vth)
+    y = i - i_l + i_s * exp_term_2 + v_diode / r_p
 
-    return y
+    # Compute the derivative of the objective function w.r.t. the current
+    dy_di = 1 + i_s * r_s * inv_n_vth * (exp_term_2 + 1) + r_s / r_p
+
+    return y, dy_di
+
+
+def compute_photo_current(
+    x: np.ndarray,
+    n_s: int,
+    v_th: float,
+) -> np.ndarray:
+    """Compute the photo current of the solar cell.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The input variables of the solar cell model: I_SC, I_S, n, R_S, R_P;
+        either a single input value of length 5 or an N-by-5 array.
+    n_s : int
+        The number of cells connected in series.
+    v_th : float
+        The thermal voltage value at 25degC [V]
+
+    Returns
+    -------
+    np.ndarray
+        The photo current [A]; either a scalar or an array of length N.
+    """
+    # Get the input variable values
+    i_sc = x[..., 0]
+    i_s = np.exp(x[..., 1])
+    n = x[..., 2]
+    r_s = x[..., 3]
+    r_p = x[..., 4]
+
+    # Compute the photo current
+    exp_term_1 = np.expm1(i_sc * r_s / (n_s * n * v_th))
+    i_l = i_sc + i_s * exp_term_1 + i_sc * r_s / r_p
+
+    return i_l
 
 
 def compute_current(
@@ -166,17 +280,118 @@ def compute_current(
     v_th : float
         The thermal voltage value at 25degC [V]
 
+    kwargs : dict
+        The additional parameters to be passed to `newton()`.
+
     Returns
     -------
     float
         The current that corresponds to the given voltage.
     """
-    i0 = np.array([0.0])
-    # Find the corresponding current as the root
-    sol = root(obj_fun_root, i0, args=(v, x, n_s, v_th), **kwargs)
-    i = sol.x
+    # Find the corresponding current as the root; the root equation is
+    # monotonically increasing and convex in the current
+    i = newton(
+        obj_fun_root,
+        0.0,
+        fprime=obj_fun_root_prime,
+        args=(v, x, n_s, v_th),
+        **kwargs,
+    )
+
+    return float(i)
+
+
+def compute_currents(
+    vv: np.ndarray,
+    xx: np.ndarray,
+    n_s: int,
+    v_th: float,
+    ii0: Optional[np.ndarray] = None,
+    i_l: Optional[np.ndarray] = None,
+    tol: float = 1.48e-8,
+    maxiter: int = 50,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the currents of the solar cell given a set of voltage values.
+
+    The implicit currents of all the N input values are solved simultaneously
+    by a vectorized Newton iteration; the derivatives of the currents with
+    respect to the voltage are obtained by implicit differentiation.
+
+    Parameters
+    ----------
+    vv : np.ndarray
+        The voltage values [V], an array of length N.
+    xx : np.ndarray
+        A five-dimensional input values of the solar cell model given by
+        an N-by-5 array where N is the number of input values.
+    n_s : int
+        The number of cells connected in series.
+    v_th : float
+        The thermal voltage value at 25degC [V]
+    ii0 : np.ndarray, optional
+        The initial guess of the currents, an array of length N.
+        If not specified, the iteration starts from zero currents.
+    i_l : np.ndarray, optional
+        The photo currents, an array of length N.
+        If not specified, they are computed from the input values.
+    tol : float, optional
+        The absolute tolerance of the Newton step.
+    maxiter : int, optional
+        The maximum number of Newton iterations.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The currents that correspond to the given voltage values and
+        their derivatives with respect to the voltage.
+    """
+    if ii0 is None:
+        ii = np.zeros(len(xx))
+    else:
+        ii = np.array(ii0, dtype=float)
+    # The photo currents are invariant across the iterations
+    if i_l is None:
+        i_l = compute_photo_current(xx, n_s, v_th)
+    for _ in range(maxiter):
+        yy, dyy_di = obj_fun_root_and_prime(ii, vv, xx, n_s, v_th, i_l)
+        step = yy / dyy_di
+        ii -= step
+        if np.all(np.abs(step) < tol):
+            break
+    else:
+        _warn_not_converged("Newton iteration for the currents", step, tol)
+
+    # Implicit differentiation of the root equation; the derivative w.r.t.
+    # the voltage is that w.r.t. the current (minus one) divided by R_S
+    dii_dv = (1 - dyy_di) / xx[:, 3] / dyy_di
+
+    return ii, dii_dv
+
+
+def _warn_not_converged(name: str, step: np.ndarray, tol: float) -> None:
+    """Warn about the input values whose iteration has not converged.
 
-    return i
+    Parameters
+    ----------
+    name : str
+        The name of the iteration used in the warning message.
+    step : np.ndarray
+        The last steps of the iteration, an array of length N.
+    tol : float
+        The absolute tolerance of the step.
+    """
+    idx = np.flatnonzero(~(np.abs(step) < tol))
+    if idx.size == 0:
+        return
+
+    warnings.warn(
+        message=(
+            f"The {name} did not converge for {idx.size} out of "
+            f"{len(step)} input values (rows: {idx.tolist()})."
+        ),
+        category=RuntimeWarning,
+        stacklevel=3,
+    )
 
 
 def compute_power_max(
@@ -187,6 +402,12 @@ def compute_power_max(
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Compute the maximum power a solar cell given its design parameters.
 
+    The power is unimodal in the voltage, so its maximum is where
+    the derivative of the power with respect to the voltage vanishes.
+    The roots of the derivative for all the N input values are found
+    simultaneously by a vectorized regula falsi (Illinois variant)
+    bracketed from zero up to an upper bound of the open-circuit voltage.
+
     Parameters
     ----------
     xx : np.ndarray
@@ -197,10 +418,17 @@ def compute_power_max(
     v_th : float
         The thermal voltage value at 25degC [V]
     kwargs : dict
-        The additional parameters to be passed either to `root()` or
-        `minimize()`. A dictionary value of key `root` will be passed to
-        `root()`, while a dictionary value of key `minimize` will be passed to
-        `minimize()`
+        The additional parameters (i.e., `tol` and `maxiter`) to be passed
+        either to the Newton iteration for the current or to the bracketed
+        search for the maximum power. A dictionary value of key `root` will be
+        passed to the former, while a dictionary value of key `minimize` will
+        be passed to the latter.
+
+    Raises
+    ------
+    TypeError
+        If the solver parameters of the maximum power search contain keys
+        other than `tol` and `maxiter`.
 
     Returns
     -------
@@ -208,37 +436,68 @@ def compute_power_max(
         A pair of arrays containing the maximum power a solar cell and the
         corresponding voltage.
     """
-    # Initialize output array
-    pp_max = np.empty(len(xx))
-    vv_max = np.empty(len(xx))
-
-    # Get additional arguments for root and minimize
+    # Get additional arguments for the current and the power maximization
     root_kwargs = kwargs.get("root", {})
     minimize_kwargs = kwargs.get("minimize", {})
+    unknown_keys = set(minimize_kwargs) - {"tol", "maxiter"}
+    if unknown_keys:
+        raise TypeError(
+            f"Unexpected solver parameter(s) {sorted(unknown_keys)} "
+            f"for the maximum power search; only 'tol' and 'maxiter' "
+            f"are supported."
+        )
+    tol = minimize_kwargs.get("tol", 1.48e-8)
+    maxiter = minimize_kwargs.get("maxiter", 500)
 
-    for idx in range(len(xx)):
-        # Set up the objective function (negated for minimization)
-        x = xx[idx]
-
-        def _obj_fun(v, x, n_s, v_th, root_kwargs):
-            return -1 * v * compute_current(v, x, n_s, v_th, **root_kwargs)
+    # The photo currents depend only on the input values
+    i_l = compute_photo_current(xx, n_s, v_th)
 
-        # Minimize the objective function
-        v0 = np.array([0.0])
-        res = minimize(
-            _obj_fun,
-            v0,
-            args=(x, n_s, v_th, root_kwargs),
-            **minimize_kwargs,
+    def _power_prime(vv, ii0):
+        ii, dii_dv = compute_currents(
+            vv, xx, n_s, v_th, ii0, i_l, **root_kwargs
         )
-
-        pp_max[idx] = -1 * res.fun  # Negated back for the maximum value
-        vv_max[idx] = res.x
+        return ii + vv * dii_dv, ii
+
+    # Bracket the voltage; the voltage at which the diode current alone
+    # balances the photo current bounds the open-circuit voltage from above
+    vv_lb = np.zeros(len(xx))
+    vv_ub = n_s * xx[:, 2] * v_th * np.log1p(i_l / np.exp(xx[:, 1]))
+    # The derivative of the power is positive at the lower bound (the current)
+    # and negative at the upper bound (the current is non-positive there)
+    dpp_lb, ii = _power_prime(vv_lb, None)
+    dpp_ub, ii = _power_prime(vv_ub, None)
+
+    # Regula falsi (Illinois) for the root of the derivative of the power;
+    # the Newton iteration for the currents is warm-started from the currents
+    # of the previous voltage iterates
+    for _ in range(maxiter):
+        step = dpp_ub * (vv_ub - vv_lb) / (dpp_ub - dpp_lb)
+        vv_new = vv_ub - step
+        dpp_new, ii = _power_prime(vv_new, ii)
+        # Keep the root bracketed; halve the value of the retained end point
+        # if the same end point is retained twice in a row
+        is_flipped = np.signbit(dpp_new) != np.signbit(dpp_ub)
+        vv_lb = np.where(is_flipped, vv_ub, vv_lb)
+        dpp_lb = np.where(is_flipped, dpp_ub, dpp_lb / 2)
+        vv_ub = vv_new
+        dpp_ub = dpp_new
+        if np.all(np.abs(step) < tol):
+            break
+    else:
+        _warn_not_converged("search for the maximum power", step, tol)
+
+    vv_max = vv_ub
+    pp_max = vv_max * ii
 
     return pp_max, vv_max
 
 
-def evaluate(xx: np.ndarray, n_s: int, v_th: float, **kwargs) -> np.ndarray:
+def evaluate(
+    xx: np.ndarray,
+    n_s: int,
+    v_th: float,
+    **kwargs,
+) -> np.ndarray:
     """Evaluate the solar cell model on a set of input values.
 
     Parameters
@@ -246,6 +505,12 @@ def evaluate(xx: np.ndarray, n_s: int, v_th: float, **kwargs) -> np.ndarray:
     xx : np.ndarray
         A five-dimensional input values given by an N-by-5 array
         where N is the number of input values.
+    n_s : int
+        The number of cells connected in series.
+    v_th : float
+        The thermal voltage value at 25degC [V]
+    kwargs : dict
+        The additional parameters to be passed to `compute_power_max()`.
 
     Returns
     -------
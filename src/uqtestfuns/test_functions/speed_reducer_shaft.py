@@ -23,6 +23,8 @@ References
 
 import numpy as np
 
+from typing import Optional
+
 from uqtestfuns.core.custom_typing import ProbInputSpecs
 from uqtestfuns.core.uqtestfun_abc import UQTestFunFixDimABC
 from .utils import gumbel_max_mu, gumbel_max_beta
@@ -74,7 +76,7 @@ AVAILABLE_INPUTS: ProbInputSpecs = {
 }
 
 
-def evaluate(xx: np.ndarray) -> np.ndarray:
+def evaluate(xx: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """Evaluate the speed reducer shaft test function on a set of input values.
 
     Parameters
@@ -82,6 +84,9 @@ def evaluate(xx: np.ndarray) -> np.ndarray:
     xx : np.ndarray
         A five-dimensional input values given by N-by-5 arrays
         where N is the number of input values.
+    out : np.ndarray, optional
+        A preallocated array of length N to store the output values.
+        If not specified, a new array is allocated.
 
     Returns
     -------
@@ -96,10 +101,17 @@ def evaluate(xx: np.ndarray) -> np.ndarray:
     tt = xx[:, 3]  # torque [Nm]
     ss = xx[:, 4]  # strength [MPa]
 
-    # NOTE: Convert [MPa] to [Pa] and [mm] to [m]
-    yy = ss * 1e6 - (32 / np.pi / (dd / 1e3) ** 3) * np.sqrt(
-        ff**2 * (ll / 1e3) ** 2 / 16 + tt**2
-    )
+    # NOTE: Convert [MPa] to [Pa] and [mm] to [m], i.e., the factors 1e6, 1e-6
+    #       (for the squared span), and 1e9 (for the inverse cubed diameter)
+    # NOTE: Powers are expanded into products and computed in-place
+    yy = np.multiply(ff, ll, out=out)
+    yy *= yy
+    yy *= 1e-6 / 16
+    yy += tt * tt
+    np.sqrt(yy, out=yy)
+    yy /= dd * dd * dd
+    yy *= -32e9 / np.pi
+    yy += ss * 1e6
 
     return yy
 
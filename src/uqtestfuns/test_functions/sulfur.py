@@ -61,6 +61,8 @@ References
 
 import numpy as np
 
+from typing import Optional
+
 from uqtestfuns.core.custom_typing import MarginalSpecs, ProbInputSpecs
 from uqtestfuns.core.uqtestfun_abc import UQTestFunFixDimABC
 
@@ -147,7 +149,7 @@ EARTH_AREA = 5.1e14  # [m^2] from [5]
 DAYS_IN_YEAR = 365  # [days]
 
 
-def evaluate(xx: np.ndarray) -> np.ndarray:
+def evaluate(xx: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """Evaluate the Sulfur model test function on a set of input values.
 
     References
@@ -155,6 +157,9 @@ def evaluate(xx: np.ndarray) -> np.ndarray:
     xx : np.ndarray
         A nine-dimensional input values given by an N-by-9 array
         where N is the number of input values.
+    out : np.ndarray, optional
+        A preallocated array of length N to store the output values.
+        If not specified, a new array is allocated.
 
     Returns
     -------
@@ -162,37 +167,28 @@ def evaluate(xx: np.ndarray) -> np.ndarray:
         The output of the Sulfur model test function, i.e.,
         the direct radiative forcing by sulfate aerosols.
     """
-    # Source strength of anthropogenic Sulfur (initially given in Teragram)
-    qq = xx[:, 0] * 1e12
-    # Fraction of SO2 oxidized to SO4(2-) aerosol
-    yy = xx[:, 1]
-    # Average lifetime of atmospheric SO4(2-)
-    ll = xx[:, 2]
-    # Aerosol mass scattering efficiency
-    psi_e = xx[:, 3]
-    # Fraction of light scattered upward hemisphere
-    beta = xx[:, 4]
-    # Fractional increase in aerosol scattering eff. due hygroscopic growth
-    ff_psi = xx[:, 5]
-    # Square of atmospheric transmittance above aerosol layer
-    tt_sq = xx[:, 6]
-    # Fraction of earth not covered by cloud
-    aa_c_complement = xx[:, 7]
-    # Square of surface coalbedo
-    co_rr_s_sq = xx[:, 8]
-
-    # Sulfate burden (Eq. (5) in [1], notation from [2])
+    # The direct radiative forcing by sulfate aerosols is a product of
+    # all the input variables (see Eqs. (4) and (5) in [1], notation from [2]):
+    #   - xx[:, 0]: Source strength of anthropogenic Sulfur (in Teragram)
+    #   - xx[:, 1]: Fraction of SO2 oxidized to SO4(2-) aerosol
+    #   - xx[:, 2]: Average lifetime of atmospheric SO4(2-)
+    #   - xx[:, 3]: Aerosol mass scattering efficiency
+    #   - xx[:, 4]: Fraction of light scattered upward hemisphere
+    #   - xx[:, 5]: Fractional increase in aerosol scattering eff. due
+    #               hygroscopic growth
+    #   - xx[:, 6]: Square of atmospheric transmittance above aerosol layer
+    #   - xx[:, 7]: Fraction of earth not covered by cloud
+    #   - xx[:, 8]: Square of surface coalbedo
+    # NOTE: Factor 1e12 due to conversion of the source strength to [gS / year]
     # NOTE: Factor 3.0 due to conversion of mass from S to SO4(2-)
     # NOTE: Factor 1/365.0 due to average lifetime is given in [days]
-    #       while qq is in [gS / year]
-    sulfate_burden = 3.0 * qq * yy * ll / EARTH_AREA / DAYS_IN_YEAR
-
-    # Loading of sulfate aerosol (Eq. (4) in [1], notation from [2])
-    sulfate_loading = psi_e * ff_psi * sulfate_burden
+    #       while the source strength is in [gS / year]
+    factor = -0.5 * SOLAR_CONSTANT * 3.0 * 1e12 / EARTH_AREA / DAYS_IN_YEAR
 
-    # Direct radiative forcing by sulfate aerosols
-    factor_1 = SOLAR_CONSTANT * aa_c_complement * tt_sq * co_rr_s_sq * beta
-    dd_f = -0.5 * factor_1 * sulfate_loading
+    # Accumulate the product column by column in a single output array
+    dd_f = np.multiply(xx[:, 0], factor, out=out)
+    for i in range(1, xx.shape[1]):
+        np.multiply(dd_f, xx[:, i], out=dd_f)
 
     return dd_f
 
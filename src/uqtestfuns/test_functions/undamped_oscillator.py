@@ -42,6 +42,8 @@ as a test function for metamodeling exercises.
 
 import numpy as np
 
+from typing import Optional
+
 from uqtestfuns.core.custom_typing import ProbInputSpecs
 from uqtestfuns.core.uqtestfun_abc import UQTestFunFixDimABC
 
@@ -191,7 +193,7 @@ AVAILABLE_INPUTS: ProbInputSpecs = {
 }
 
 
-def evaluate(xx: np.ndarray) -> np.ndarray:
+def evaluate(xx: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """Evaluate the undamped oscillator test function on a set of input values.
 
     Parameters
@@ -199,6 +201,9 @@ def evaluate(xx: np.ndarray) -> np.ndarray:
     xx : np.ndarray
         A two-dimensional input values given by N-by-6 arrays
         where N is the number of input values.
+    out : np.ndarray, optional
+        A preallocated array of length N to store the output values.
+        If not specified, a new array is allocated.
 
     Returns
     -------
@@ -207,12 +212,21 @@ def evaluate(xx: np.ndarray) -> np.ndarray:
         If negative, then the system is in failed state.
         The output is a 1-dimensional array of length N.
     """
-    omega_0 = np.sqrt((xx[:, 1] + xx[:, 2]) / xx[:, 0])
-    term_1 = 3 * xx[:, 3]
-    term_2 = 2 * xx[:, 4] / xx[:, 0] / omega_0**2
-    term_3 = np.sin(omega_0 * xx[:, 5] / 2)
-
-    yy = term_1 - np.abs(term_2 * term_3)
+    # NOTE: The mass times the squared natural frequency is the total
+    #       stiffness, so the amplitude term needs no squared frequency.
+    #       The terms are computed in-place to avoid temporary arrays.
+    stiffness = xx[:, 1] + xx[:, 2]
+    omega_0 = np.divide(stiffness, xx[:, 0], out=out)
+    np.sqrt(omega_0, out=omega_0)
+
+    yy = omega_0  # Reuse the array as the output
+    yy *= xx[:, 5]
+    yy *= 0.5
+    np.sin(yy, out=yy)
+    yy *= 2 * xx[:, 4]
+    yy /= stiffness
+    np.abs(yy, out=yy)
+    np.subtract(3 * xx[:, 3], yy, out=yy)
 
     return yy
 
@@ -2,23 +2,38 @@
 Utility module for the test_functions sub-package.
 """
 
+import functools
 import numpy as np
 
+from typing import Any, Callable, Optional
 
-def deg2rad(xx: np.ndarray) -> np.ndarray:
+# Number of rows per block such that the intermediate arrays of length
+# equal to the number of rows in a block remain in the CPU cache
+BLOCK_SIZE = 16384
+
+# Number of rows below which an N-by-M expression is evaluated on the whole
+# array at once; a loop over the M columns only pays off once its
+# per-column overhead is amortized over enough rows
+MIN_ROWS_COLUMN_LOOP = 1024
+
+
+def deg2rad(xx: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """Convert angles given in degree to radians.
 
     Parameters
     ----------
     xx : np.ndarray
         Angles in degree.
+    out : np.ndarray, optional
+        The array to store the angles in radians; it may be `xx` itself
+        for an in-place conversion.
 
     Returns
     -------
     np.ndarray
         Angles in radians.
     """
-    yy = np.pi / 180.0 * xx
+    yy = np.deg2rad(xx, out=out)
 
     return yy
 
@@ -115,3 +130,100 @@ def gumbel_max_beta(std: float) -> float:
     beta = std * np.sqrt(6) / np.pi
 
     return beta
+
+
+def cache_read_only(
+    func: Callable[[int], np.ndarray],
+) -> Callable[[int], np.ndarray]:
+    """Cache a dimension-dependent parameter array as a read-only array.
+
+    Parameters
+    ----------
+    func : Callable[[int], np.ndarray]
+        A function that constructs a parameter array given the input dimension.
+
+    Returns
+    -------
+    Callable[[int], np.ndarray]
+        The cached function; the array for a given input dimension is
+        constructed only once and shared (read-only) across all calls.
+
+    Notes
+    -----
+    - The returned arrays cannot be modified in-place. To modify the value
+      of a parameter, make a copy first or assign a new array.
+    """
+
+    @functools.lru_cache(maxsize=None)
+    @functools.wraps(func)
+    def wrapper(input_dimension: int) -> np.ndarray:
+        yy = func(input_dimension)
+        yy.flags.writeable = False
+
+        return yy
+
+    return wrapper
+
+
+def evaluate_by_blocks(
+    func: Callable[..., np.ndarray],
+    xx: np.ndarray,
+    *args: Any,
+    block_size: int = BLOCK_SIZE,
+    out: Optional[np.ndarray] = None,
+    **kwargs: Any,
+) -> np.ndarray:
+    """Evaluate a function on consecutive blocks of rows of the input values.
+
+    Parameters
+    ----------
+    func : Callable[..., np.ndarray]
+        The function to evaluate; it must operate row-wise on the input
+        values, i.e., each output row only depends on the same input row.
+    xx : np.ndarray
+        Input values given by an N-by-M array where N is the number of
+        input values.
+    *args : Any
+        Additional positional arguments passed to the function.
+    block_size : int, optional
+        The number of rows in each block. Default is `BLOCK_SIZE`.
+    out : np.ndarray, optional
+        A preallocated array to store the output values. If specified,
+        the slice of `out` that corresponds to each block is passed to
+        the function as the `out` keyword argument, and the function must
+        write its output there. If not specified, a new array is allocated.
+    **kwargs : Any
+        Additional keyword arguments passed to the function.
+
+    Returns
+    -------
+    np.ndarray
+        The output of the function evaluated on all the input values.
+
+    Notes
+    -----
+    - For a large number of input values, evaluating an element-wise
+      expression on the whole array moves each intermediate array between
+      the CPU and the main memory. Evaluating it block by block keeps
+      the intermediate arrays in the CPU cache.
+    """
+    num_samples = xx.shape[0]
+    if out is not None:
+        for start in range(0, num_samples, block_size):
+            end = start + block_size
+            func(xx[start:end], *args, out=out[start:end], **kwargs)
+
+        return out
+
+    if num_samples <= block_size:
+        return func(xx, *args, **kwargs)
+
+    yy_block = func(xx[:block_size], *args, **kwargs)
+    shape = (num_samples,) + yy_block.shape[1:]
+    yy = np.empty(shape, dtype=yy_block.dtype)
+    yy[:block_size] = yy_block
+    for start in range(block_size, num_samples, block_size):
+        end = start + block_size
+        yy[start:end] = func(xx[start:end], *args, **kwargs)
+
+    return yy
@@ -63,7 +63,10 @@ def evaluate(xx: np.ndarray):
         The output of the 2D Webster function evaluated on the input values.
         The output is a 1-dimensional array of length N.
     """
-    yy = xx[:, 0] ** 2 + xx[:, 1] ** 3
+    # NOTE: Powers are expanded into products and accumulated in-place
+    yy = xx[:, 1] * xx[:, 1]
+    yy *= xx[:, 1]
+    yy += xx[:, 0] * xx[:, 0]
 
     return yy
 
@@ -23,6 +23,7 @@ import numpy as np
 
 from uqtestfuns.core.custom_typing import MarginalSpecs, ProbInputSpecs
 from uqtestfuns.core.uqtestfun_abc import UQTestFunFixDimABC
+from .utils import evaluate_by_blocks
 
 __all__ = ["Welch1992"]
 
@@ -52,6 +53,33 @@ AVAILABLE_INPUTS: ProbInputSpecs = {
 
 DEFAULT_INPUT_SELECTION = "Welch1992"
 
+# Coefficients of the terms that are linear in the input variables
+# (x8 and x16 are inert; x1, x4, x12, x13, and x20 only appear non-linearly)
+LINEAR_COEFFICIENTS = np.array(
+    [
+        0.0,
+        0.05,
+        0.08,
+        0.0,
+        1.0,
+        -0.03,
+        0.03,
+        0.0,
+        -0.09,
+        -0.01,
+        -0.07,
+        0.0,
+        0.0,
+        -0.04,
+        0.06,
+        0.0,
+        -0.01,
+        -0.03,
+        -5.0,
+        0.0,
+    ]
+)
+
 
 def evaluate(xx: np.ndarray) -> np.ndarray:
     """Evaluate the Welch et al. (1992) function on a set of input values.
@@ -72,26 +100,29 @@ def evaluate(xx: np.ndarray) -> np.ndarray:
     -----
     - The input variables xx[:, 7] (x8) and xx[:, 15] (x16) are inert and
       therefore, does not appear in the computation below.
+    - If the input values are given in single precision (``np.float32``),
+      the function is evaluated and returned in single precision as well.
     """
-    yy = (
-        (5 * xx[:, 11]) / (1 + xx[:, 0])
-        + 5 * (xx[:, 3] - xx[:, 19]) ** 2
-        + xx[:, 4]
-        + 40 * xx[:, 18] ** 3
-        - 5 * xx[:, 18]
-        + 0.05 * xx[:, 1]
-        + 0.08 * xx[:, 2]
-        - 0.03 * xx[:, 5]
-        + 0.03 * xx[:, 6]
-        - 0.09 * xx[:, 8]
-        - 0.01 * xx[:, 9]
-        - 0.07 * xx[:, 10]
-        + 0.25 * xx[:, 12] ** 2
-        - 0.04 * xx[:, 13]
-        + 0.06 * xx[:, 14]
-        - 0.01 * xx[:, 16]
-        - 0.03 * xx[:, 17]
-    )
+    coeffs = LINEAR_COEFFICIENTS
+    if xx.dtype == np.float32:
+        coeffs = coeffs.astype(np.float32)
+
+    yy = evaluate_by_blocks(_evaluate_block, xx, coeffs)
+
+    return yy
+
+
+def _evaluate_block(xx: np.ndarray, coeffs: np.ndarray) -> np.ndarray:
+    """Evaluate the Welch et al. (1992) function on a block of input values."""
+    # Compute all the linear terms in a single matrix-vector product
+    yy = xx @ coeffs
+
+    # Add the non-linear terms in-place
+    yy += 5 * xx[:, 11] / (1 + xx[:, 0])
+    xx_diff = xx[:, 3] - xx[:, 19]
+    yy += 5 * xx_diff * xx_diff
+    yy += 40 * xx[:, 18] * xx[:, 18] * xx[:, 18]
+    yy += 0.25 * xx[:, 12] * xx[:, 12]
 
     return yy
 
@@ -22,9 +22,11 @@ References
 
 import numpy as np
 
+from typing import Optional
+
 from uqtestfuns.core.custom_typing import MarginalSpecs, ProbInputSpecs
 from uqtestfuns.core.uqtestfun_abc import UQTestFunFixDimABC
-from .utils import deg2rad
+from .utils import deg2rad, evaluate_by_blocks
 
 __all__ = ["WingWeight"]
 
@@ -104,8 +106,21 @@ AVAILABLE_INPUTS: ProbInputSpecs = {
     },
 }
 
-
-def evaluate(xx: np.ndarray) -> np.ndarray:
+# Column indices of the input variables and their exponents in the product of
+# powers (Sw, Wfw, A, q, lambda, t/c, Nz, Wdg); Lambda and Wp are excluded
+WING_WEIGHT_EXPONENTS = (
+    (0, 0.758),
+    (1, 0.0035),
+    (2, 0.6),
+    (4, 0.006),
+    (5, 0.04),
+    (6, -0.3),
+    (7, 0.49),
+    (8, 0.49),
+)
+
+
+def evaluate(xx: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """Evaluate the Wing Weight function on a set of input values.
 
     Parameters
@@ -113,6 +128,9 @@ def evaluate(xx: np.ndarray) -> np.ndarray:
     xx : np.ndarray
         10-Dimensional input values given by N-by-10 arrays where
         N is the number of input values.
+    out : np.ndarray, optional
+        A preallocated array of length N to store the output values.
+        If not specified, a new array is allocated.
 
     Returns
     -------
@@ -120,17 +138,46 @@ def evaluate(xx: np.ndarray) -> np.ndarray:
         The output of the Wing Weight function evaluated
         on the input values.
         The output is a 1-dimensional array of length N.
+
+    Notes
+    -----
+    - If the input values are given in single precision (``np.float32``),
+      the function is evaluated and returned in single precision as well;
+      all the operations below either involve Python scalars or are in-place.
     """
+    yy = evaluate_by_blocks(_evaluate_block, xx, out=out)
+
+    return yy
+
+
+def _evaluate_block(
+    xx: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Evaluate the Wing Weight function on a block of input values."""
+    # The block fits in the cache, so converting it to column-major order
+    # is cheap and makes the column reads below contiguous
+    xx = np.asfortranarray(xx)
+
     # Compute the Wing Weight function
-    term_1 = 0.036 * xx[:, 0] ** 0.758 * xx[:, 1] ** 0.0035
-    term_2 = (xx[:, 2] / np.cos(deg2rad(xx[:, 3])) ** 2) ** 0.6
-    term_3 = xx[:, 4] ** 0.006
-    term_4 = xx[:, 5] ** 0.04
-    term_5 = (100 * xx[:, 6] / np.cos(np.pi / 180.0 * xx[:, 3])) ** (-0.3)
-    term_6 = (xx[:, 7] * xx[:, 8]) ** 0.49
-    term_7 = xx[:, 0] * xx[:, 9]
-
-    yy = term_1 * term_2 * term_3 * term_4 * term_5 * term_6 + term_7
+    # NOTE: The product of powers is computed as the exponential of
+    #       the weighted sum of logarithms, i.e., a log per variable and
+    #       a single exp instead of a pow per term
+    # NOTE: The cosine of the sweep angle appears in two terms with
+    #       the exponents -1.2 and 0.3; 0.036 and 100**(-0.3) are constants
+    # NOTE: The terms are accumulated in-place using a single scratch buffer
+    yy = deg2rad(xx[:, 3], out=out)
+    np.cos(yy, out=yy)
+    np.log(yy, out=yy)
+    yy *= -0.9
+    yy += np.log(0.036) - 0.3 * np.log(100.0)
+    buf = np.empty_like(yy)
+    for j, exponent in WING_WEIGHT_EXPONENTS:
+        np.log(xx[:, j], out=buf)
+        buf *= exponent
+        yy += buf
+    np.exp(yy, out=yy)
+    np.multiply(xx[:, 0], xx[:, 9], out=buf)
+    yy += buf
 
     return yy
 
@@ -2,8 +2,9 @@
 Utility module used across package.
 """
 
-import os
+import functools
 import inspect
+import pkgutil
 
 from importlib import import_module
 from typing import List, Optional, Tuple, Any
@@ -36,37 +37,45 @@ def get_available_classes(
     List[Tuple[str, str]]
         List of tuples each element of which is the found class name and
         the fully-qualified class path.
-    """
 
+    Notes
+    -----
+    - The modules of a package are only imported and inspected once
+      for a given set of excluded modules; subsequent calls return
+      the cached results.
+    """
     if exclude is None:
         exclude = []
 
+    classes = _get_available_classes(package, tuple(sorted(exclude)))
+
+    return list(classes)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_available_classes(
+    package: ModuleType, exclude: Tuple[str, ...]
+) -> Tuple[Tuple[str, Any], ...]:
+    """Get the available classes within a given package (cached)."""
     # Verify package
     err_msg = f"Invalid package name {package}!"
     try:
-        package_file = package.__file__
-        if package_file is None:
-            raise ValueError(err_msg)
+        package_path = package.__path__
     except AttributeError:
         raise AttributeError(err_msg)
 
-    # Get the full path of a (sub-) package
-    package_dir = os.path.dirname(package_file)
-
-    # Get all modules within the package
-    all_modules = os.listdir(package_dir)
+    # Get all modules within the package (sub-packages are not searched)
+    all_modules = pkgutil.iter_modules(package_path, f"{package.__name__}.")
 
     classes = []
-    for module in all_modules:
-        if module.endswith(".py"):
-            # Create the full module name
-            module_name = f"{package.__name__}.{module.replace('.py', '')}"
-            if module_name not in exclude:
-                all_members = import_module(module_name)
-                all_classes = inspect.getmembers(all_members, inspect.isclass)
-                for class_name, class_path in all_classes:
-                    if class_path.__module__ == module_name:
-                        # This is the class that is defined in the module
-                        classes.append((class_name, class_path))
+    for _, module_name, is_pkg in all_modules:
+        if is_pkg or module_name in exclude:
+            continue
+        all_members = import_module(module_name)
+        all_classes = inspect.getmembers(all_members, inspect.isclass)
+        for class_name, class_path in all_classes:
+            if class_path.__module__ == module_name:
+                # This is the class that is defined in the module
+                classes.append((class_name, class_path))
 
-    return classes
+    return tuple(classes)
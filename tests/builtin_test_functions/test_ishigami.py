@@ -23,12 +23,17 @@ def ishigami_fun(request):
     return ishigami
 
 
-def test_compute_mean(ishigami_fun):
+@pytest.fixture(scope="module")
+def ishigami_sample():
+    """Monte Carlo sample shared by the parameter sets (same input)."""
+    return Ishigami().prob_input.get_sample(1000000)
+
+
+def test_compute_mean(ishigami_fun, ishigami_sample):
     """Test the mean computation as the result is analytical."""
 
     # Compute mean via Monte Carlo
-    xx = ishigami_fun.prob_input.get_sample(1000000)
-    yy = ishigami_fun(xx)
+    yy = ishigami_fun(ishigami_sample)
 
     mean_mc = np.mean(yy)
 
@@ -39,12 +44,11 @@ def test_compute_mean(ishigami_fun):
     assert np.allclose(mean_mc, mean_ref, rtol=1e-2)
 
 
-def test_compute_variance(ishigami_fun):
+def test_compute_variance(ishigami_fun, ishigami_sample):
     """Test the variance computation as the result is analytical."""
 
     # Compute variance via Monte Carlo
-    xx = ishigami_fun.prob_input.get_sample(1000000)
-    yy = ishigami_fun(xx)
+    yy = ishigami_fun(ishigami_sample)
 
     var_mc = np.var(yy)
 
@@ -21,10 +21,10 @@ def test_inert_inputs():
     assert piston_ben_ari.prob_input is not None
     assert piston_moon.prob_input is not None
 
-    # Generate sample and compare both
+    # Generate a single sample and compare both on its leading columns
     num_sample = 1000000
-    xx_ben_ari = piston_ben_ari.prob_input.get_sample(num_sample)
     xx_moon = piston_moon.prob_input.get_sample(num_sample)
+    xx_ben_ari = xx_moon[:, : piston_ben_ari.input_dimension]
 
     yy_ben_ari = piston_ben_ari(xx_ben_ari)
     yy_moon = piston_moon(xx_moon)
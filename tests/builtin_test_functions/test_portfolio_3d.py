@@ -23,6 +23,12 @@ def portfolio3d_fun(request):
     return portfolio3d
 
 
+@pytest.fixture(scope="module")
+def portfolio3d_sample():
+    """Monte Carlo sample shared by the parameter sets (same input)."""
+    return Portfolio3D().prob_input.get_sample(10000000)
+
+
 def test_compute_mean(portfolio3d_fun):
     """Test the analytical mean."""
 
@@ -43,12 +49,11 @@ def test_compute_mean(portfolio3d_fun):
     assert np.allclose(mean_ref, 0)
 
 
-def test_compute_variance(portfolio3d_fun):
+def test_compute_variance(portfolio3d_fun, portfolio3d_sample):
     """Test the analytical variance."""
 
     # Compute variance via Monte Carlo
-    xx = portfolio3d_fun.prob_input.get_sample(10000000)
-    yy = portfolio3d_fun(xx)
+    yy = portfolio3d_fun(portfolio3d_sample)
 
     var_mc = np.var(yy)
 
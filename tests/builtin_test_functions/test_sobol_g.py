@@ -7,10 +7,13 @@ Notes
   the correctness of the evaluation.
 """
 
+import itertools
+
 import numpy as np
 import pytest
 
 from uqtestfuns.test_functions import SobolG
+from uqtestfuns.test_functions.utils import MIN_ROWS_COLUMN_LOOP
 
 available_parameters = list(SobolG.available_parameters.keys())
 
@@ -23,10 +26,15 @@ def test_wrong_param_selection():
 
 # ATTENTION: some parameters choice (e.g., "sobol-1")
 # can't be estimated properly with low N at high dimension
-@pytest.mark.parametrize("input_dimension", [1, 2, 3, 10])
-@pytest.mark.parametrize("params_selection", available_parameters)
-def test_compute_mean(input_dimension, params_selection):
-    """Test the mean computation as the result is analytical."""
+# ATTENTION: parameters with "Sobol-1" is unstable at large dimension >= 15
+@pytest.fixture(
+    scope="module",
+    params=list(itertools.product(available_parameters, [1, 2, 3, 10])),
+    ids=lambda param: f"{param[0]}-{param[1]}",
+)
+def sobol_g_mc(request):
+    """Monte Carlo sample shared by the mean and variance tests."""
+    params_selection, input_dimension = request.param
 
     # Create an instance of Sobol-G test function
     my_fun = SobolG(
@@ -34,13 +42,19 @@ def test_compute_mean(input_dimension, params_selection):
         parameters_id=params_selection,
     )
 
+    xx = my_fun.prob_input.get_sample(1000000)
+
+    return my_fun, my_fun(xx)
+
+
+def test_compute_mean(sobol_g_mc):
+    """Test the mean computation as the result is analytical."""
+    my_fun, yy = sobol_g_mc
+
     # Assert that ProbInput is correctly attached
     assert my_fun.prob_input is not None
 
     # Compute mean via Monte Carlo
-    xx = my_fun.prob_input.get_sample(1000000)
-    yy = my_fun(xx)
-
     mean_mc = np.mean(yy)
 
     # Analytical mean
@@ -50,25 +64,11 @@ def test_compute_mean(input_dimension, params_selection):
     assert np.allclose(mean_mc, mean_ref, rtol=1e-1)
 
 
-# ATTENTION: parameters with "Sobol-1" is unstable at large dimension >= 15
-@pytest.mark.parametrize("input_dimension", [1, 2, 3, 10])
-@pytest.mark.parametrize("params_selection", available_parameters)
-def test_compute_variance(input_dimension, params_selection):
+def test_compute_variance(sobol_g_mc):
     """Test the variance computation as the result is analytical."""
-
-    # Create an instance of the Sobol-G test function
-    my_fun = SobolG(
-        input_dimension=input_dimension,
-        parameters_id=params_selection,
-    )
-
-    # Assert that ProbInput is correctly attached
-    assert my_fun.prob_input is not None
+    my_fun, yy = sobol_g_mc
 
     # Compute the variance via Monte Carlo
-    xx = my_fun.prob_input.get_sample(500000)
-    yy = my_fun(xx)
-
     var_mc = np.var(yy)
 
     # Analytical variance
@@ -77,3 +77,71 @@ def test_compute_variance(input_dimension, params_selection):
 
     # Assertion (no need to be very ambitious with the tolerance)
     assert np.allclose(var_mc, var_ref, rtol=1e-1)
+
+
+def test_single_precision_fallback():
+    """Test the fallback to double precision when the output may overflow."""
+    my_fun = SobolG(input_dimension=200, parameters_id="Sobol1998-1")
+
+    xx = my_fun.prob_input.get_sample(1000).astype(np.float32)
+    yy = my_fun(xx)
+
+    assert yy.dtype == np.float64
+    assert np.all(np.isfinite(yy))
+
+
+@pytest.mark.parametrize("params_selection", available_parameters)
+def test_cached_parameters(params_selection):
+    """Test that the parameters are constructed once and are read-only."""
+    my_fun_1 = SobolG(input_dimension=5, parameters_id=params_selection)
+    my_fun_2 = SobolG(input_dimension=5, parameters_id=params_selection)
+
+    assert my_fun_1.parameters["aa"] is my_fun_2.parameters["aa"]
+    with pytest.raises(ValueError):
+        my_fun_1.parameters["aa"][0] = 1.0
+
+
+@pytest.mark.parametrize("params_selection", available_parameters)
+def test_evaluate_batch(params_selection):
+    """Test the batch evaluation against the evaluation of each set."""
+    my_fun = SobolG(input_dimension=5, parameters_id=params_selection)
+
+    xxs = np.stack([my_fun.prob_input.get_sample(100) for _ in range(7)])
+    yys = my_fun.evaluate_batch(xxs, **my_fun.parameters.as_dict())
+
+    assert yys.shape == (7, 100)
+    for xx, yy in zip(xxs, yys):
+        assert np.allclose(yy, my_fun(xx))
+
+    with pytest.raises(ValueError):
+        my_fun.evaluate_batch(xxs[0], **my_fun.parameters.as_dict())
+
+
+@pytest.mark.parametrize("params_selection", available_parameters)
+def test_parameters_dtype(params_selection):
+    """Test that the parameters are constructed as floating-point arrays."""
+    my_fun = SobolG(input_dimension=10, parameters_id=params_selection)
+
+    assert my_fun.parameters["aa"].dtype == np.float64
+
+
+def test_non_contiguous_input():
+    """Test the evaluation on non-contiguous input values."""
+    my_fun = SobolG(input_dimension=5)
+
+    xx = my_fun.prob_input.get_sample(1000)
+    xx_f = np.asfortranarray(xx)
+    xx_s = np.concatenate([xx, xx], axis=1)[:, ::2]
+
+    assert np.allclose(my_fun(xx_f), my_fun(xx))
+    assert np.allclose(my_fun(xx_s), my_fun(xx_s.copy()))
+
+
+@pytest.mark.parametrize("params_selection", available_parameters)
+def test_small_sample(params_selection):
+    """Test the evaluation on a few input values against a large sample."""
+    my_fun = SobolG(input_dimension=20, parameters_id=params_selection)
+
+    xx = my_fun.prob_input.get_sample(2 * MIN_ROWS_COLUMN_LOOP)
+
+    assert np.allclose(my_fun(xx[:10]), my_fun(xx)[:10])
@@ -0,0 +1,170 @@
+"""
+Test module for the Sobol'-G* test function.
+
+Notes
+-----
+- The tests defined in this module deals with
+  the correctness of the evaluation.
+"""
+
+import numpy as np
+import pytest
+
+from uqtestfuns.test_functions import SobolGStar
+from uqtestfuns.test_functions.utils import MIN_ROWS_COLUMN_LOOP
+
+available_parameters = list(SobolGStar.available_parameters.keys())
+
+
+def test_wrong_param_selection():
+    """Test a wrong selection of the parameters."""
+    with pytest.raises(KeyError):
+        SobolGStar(parameters_id="marelli1")
+
+
+@pytest.mark.parametrize("input_dimension", [1, 2, 3, 10])
+@pytest.mark.parametrize("parameters_id", available_parameters)
+def test_compute_mean(input_dimension, parameters_id):
+    """Test the mean computation as the result is analytical."""
+
+    # Create an instance of Sobol'-G* test function
+    my_fun = SobolGStar(
+        input_dimension=input_dimension,
+        parameters_id=parameters_id,
+    )
+
+    # Compute mean via Monte Carlo
+    xx = my_fun.prob_input.get_sample(1000000)
+    yy = my_fun(xx)
+
+    mean_mc = np.mean(yy)
+
+    # Analytical mean
+    mean_ref = 1.0
+
+    # Assertion (no need to be very ambitious with the tolerance)
+    assert np.allclose(mean_mc, mean_ref, rtol=1e-1)
+
+
+@pytest.mark.parametrize("input_dimension", [1, 2, 3, 10])
+@pytest.mark.parametrize("parameters_id", available_parameters)
+def test_compute_variance(input_dimension, parameters_id):
+    """Test the variance computation as the result is analytical."""
+
+    # Create an instance of the Sobol'-G* test function
+    my_fun = SobolGStar(
+        input_dimension=input_dimension,
+        parameters_id=parameters_id,
+    )
+
+    # Compute the variance via Monte Carlo
+    xx = my_fun.prob_input.get_sample(1000000)
+    yy = my_fun(xx)
+
+    var_mc = np.var(yy)
+
+    # Analytical variance
+    aa = my_fun.parameters["aa"]
+    alpha = my_fun.parameters["alpha"]
+    var_ref = (
+        np.prod(
+            ((1 + alpha) ** 2 / (1 + 2 * alpha) + 2 * aa + aa**2)
+            / (1 + aa) ** 2
+        )
+        - 1
+    )
+
+    # Assertion (no need to be very ambitious with the tolerance)
+    assert np.allclose(var_mc, var_ref, rtol=1e-1)
+
+
+@pytest.mark.parametrize("alpha", [0.5, 1.0, 2.0, 1.5])
+def test_curvature(alpha):
+    """Test the evaluation with a given curvature against the general power."""
+    my_fun = SobolGStar(input_dimension=5)
+    my_fun.parameters["alpha"] = np.full(5, alpha)
+
+    # Both the vectorized (few rows) and the column-wise evaluation
+    xx = my_fun.prob_input.get_sample(2 * MIN_ROWS_COLUMN_LOOP)
+    yy = my_fun(xx)
+
+    # Reference values using the general power function
+    aa = my_fun.parameters["aa"]
+    delta = my_fun.parameters["delta"]
+    uu = (xx + delta) % 1.0
+    yy_ref = np.prod(
+        ((1 + alpha) * np.abs(2 * uu - 1) ** alpha + aa) / (1 + aa), axis=1
+    )
+
+    assert np.allclose(yy, yy_ref)
+    assert np.allclose(my_fun(xx[:10]), yy_ref[:10])
+
+
+def test_evaluate_parameter_sets():
+    """Test the evaluation of several parameter sets at once."""
+    my_funs = [
+        SobolGStar(input_dimension=5, parameters_id=parameters_id)
+        for parameters_id in available_parameters
+    ]
+    # The shift parameters must be shared by all the sets
+    delta = my_funs[0].parameters["delta"]
+    for my_fun in my_funs:
+        my_fun.parameters["delta"] = delta
+
+    xx = my_funs[0].prob_input.get_sample(2 * MIN_ROWS_COLUMN_LOOP)
+    aa = np.stack([my_fun.parameters["aa"] for my_fun in my_funs])
+    alpha = np.stack([my_fun.parameters["alpha"] for my_fun in my_funs])
+    yys = SobolGStar.evaluate_parameter_sets(xx, aa, delta, alpha)
+
+    assert yys.shape == (len(my_funs), len(xx))
+    for my_fun, yy in zip(my_funs, yys):
+        assert np.allclose(yy, my_fun(xx))
+
+    # Few input values are evaluated on the whole array at once
+    yys_small = SobolGStar.evaluate_parameter_sets(xx[:10], aa, delta, alpha)
+    assert np.allclose(yys_small, yys[:, :10])
+
+    with pytest.raises(ValueError):
+        SobolGStar.evaluate_parameter_sets(xx, aa, delta, alpha[0])
+
+
+def test_shift_outside_unit_interval():
+    """Test the evaluation with shift parameters outside of [0, 1]."""
+    my_fun = SobolGStar(input_dimension=3)
+    my_fun.parameters["delta"] = np.array([-1.3, 2.7, 5.0])
+
+    # Both the vectorized (few rows) and the column-wise evaluation
+    xx = my_fun.prob_input.get_sample(2 * MIN_ROWS_COLUMN_LOOP)
+    yy = my_fun(xx)
+
+    # Reference values using the floor function
+    aa = my_fun.parameters["aa"]
+    delta = my_fun.parameters["delta"]
+    alpha = my_fun.parameters["alpha"]
+    uu = xx + delta - np.floor(xx + delta)
+    yy_ref = np.prod(
+        ((1 + alpha) * np.abs(2 * uu - 1) ** alpha + aa) / (1 + aa), axis=1
+    )
+
+    assert np.allclose(yy, yy_ref)
+    assert np.allclose(my_fun(xx[:10]), yy_ref[:10])
+
+
+def test_domain_bounds():
+    """Test the evaluation at the bounds of the input and shift parameters."""
+    my_fun = SobolGStar(input_dimension=3)
+    my_fun.parameters["delta"] = np.array([0.0, 0.5, 1.0])
+
+    xx = np.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.5], [1.0, 1.0, 1.0]])
+    yy = my_fun(xx)
+
+    # Reference values using the floor function
+    aa = my_fun.parameters["aa"]
+    delta = my_fun.parameters["delta"]
+    alpha = my_fun.parameters["alpha"]
+    uu = xx + delta - np.floor(xx + delta)
+    yy_ref = np.prod(
+        ((1 + alpha) * np.abs(2 * uu - 1) ** alpha + aa) / (1 + aa), axis=1
+    )
+
+    assert np.allclose(yy, yy_ref)
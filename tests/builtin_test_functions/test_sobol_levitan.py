@@ -7,6 +7,8 @@ Notes
   the correctness of the evaluation.
 """
 
+import itertools
+
 import numpy as np
 import pytest
 
@@ -21,10 +23,14 @@ def test_wrong_param_selection():
         SobolLevitan(parameters_id="marelli1")
 
 
-@pytest.mark.parametrize("input_dimension", [1, 2, 3, 10, 21])
-@pytest.mark.parametrize("parameters_id", available_parameters)
-def test_compute_mean(input_dimension, parameters_id):
-    """Test the mean computation as the result is analytical."""
+@pytest.fixture(
+    scope="module",
+    params=list(itertools.product(available_parameters, [1, 2, 3, 10, 21])),
+    ids=lambda param: f"{param[0]}-{param[1]}",
+)
+def sobol_levitan_mc(request):
+    """Monte Carlo sample shared by the mean and variance tests."""
+    parameters_id, input_dimension = request.param
 
     # Create an instance of Sobol'-Levitan test function
     my_fun = SobolLevitan(
@@ -32,10 +38,16 @@ def test_compute_mean(input_dimension, parameters_id):
         parameters_id=parameters_id,
     )
 
-    # Compute mean via Monte Carlo
     xx = my_fun.prob_input.get_sample(1000000)
-    yy = my_fun(xx)
 
+    return my_fun, my_fun(xx)
+
+
+def test_compute_mean(sobol_levitan_mc):
+    """Test the mean computation as the result is analytical."""
+    my_fun, yy = sobol_levitan_mc
+
+    # Compute mean via Monte Carlo
     mean_mc = np.mean(yy)
 
     # Analytical mean
@@ -51,21 +63,11 @@ def test_compute_mean(input_dimension, parameters_id):
         assert np.allclose(mean_mc_rel, mean_ref, rtol=1e-1)
 
 
-@pytest.mark.parametrize("input_dimension", [1, 2, 3, 10, 21])
-@pytest.mark.parametrize("parameters_id", available_parameters)
-def test_compute_variance(input_dimension, parameters_id):
+def test_compute_variance(sobol_levitan_mc):
     """Test the variance computation as the result is analytical."""
-
-    # Create an instance of the Sobol'-Levitan test function
-    my_fun = SobolLevitan(
-        input_dimension=input_dimension,
-        parameters_id=parameters_id,
-    )
+    my_fun, yy = sobol_levitan_mc
 
     # Compute the variance via Monte Carlo
-    xx = my_fun.prob_input.get_sample(1000000)
-    yy = my_fun(xx)
-
     var_mc = np.var(yy)
 
     # Analytical variance
@@ -93,3 +95,14 @@ def test_compute_variance(input_dimension, parameters_id):
 
     # Assertion (no need to be very ambitious with the tolerance)
     assert np.allclose(var_mc, var_ref, rtol=1e-1)
+
+
+def test_single_precision_fallback():
+    """Test the fallback to double precision when the output may overflow."""
+    my_fun = SobolLevitan(input_dimension=200, parameters_id="Sobol1999-1")
+
+    xx = my_fun.prob_input.get_sample(1000).astype(np.float32)
+    yy = my_fun(xx)
+
+    assert yy.dtype == np.float64
+    assert np.all(np.isfinite(yy))
@@ -0,0 +1,96 @@
+"""
+Test module for the single-diode solar cell model.
+
+Notes
+-----
+- The tests defined in this module deals with
+  the correctness of the evaluation.
+"""
+
+import numpy as np
+import pytest
+
+from uqtestfuns.test_functions import SolarCell
+from uqtestfuns.test_functions.solar_cell import (
+    compute_current,
+    compute_currents,
+    compute_power_max,
+)
+
+
+def test_compute_power_max():
+    """Test the maximum power against the current solved per input value."""
+    my_fun = SolarCell()
+    n_s = my_fun.parameters["n_s"]
+    v_th = my_fun.parameters["v_th"]
+
+    xx = my_fun.prob_input.get_sample(20)
+    pp_max, vv_max = compute_power_max(xx, n_s, v_th)
+
+    # Solve the current at the maximum power point, one input value at a time
+    ii_max = np.array(
+        [
+            compute_current(vv_max[k], xx[k], n_s, v_th, tol=1e-12)
+            for k in range(len(xx))
+        ]
+    )
+
+    # Assertions
+    assert np.allclose(pp_max, vv_max * ii_max)
+    for dv in [-1e-3, 1e-3]:
+        ii = np.array(
+            [
+                compute_current(vv_max[k] + dv, xx[k], n_s, v_th)
+                for k in range(len(xx))
+            ]
+        )
+        assert np.all(pp_max >= (vv_max + dv) * ii)
+
+
+def test_solver_parameters():
+    """Test overriding the tolerance of the solvers."""
+    my_fun = SolarCell()
+    xx = my_fun.prob_input.get_sample(100)
+    yy_ref = my_fun(xx)
+
+    my_fun.parameters.add("root", {"tol": 1e-12})
+    my_fun.parameters.add("minimize", {"tol": 1e-12, "maxiter": 1000})
+    yy_test = my_fun(xx)
+
+    # Assertion
+    assert np.allclose(yy_test, yy_ref)
+
+
+def test_compute_currents_not_converged():
+    """Test the warning if the Newton iteration for the currents stops."""
+    my_fun = SolarCell()
+    n_s = my_fun.parameters["n_s"]
+    v_th = my_fun.parameters["v_th"]
+
+    xx = my_fun.prob_input.get_sample(10)
+    vv = np.full(len(xx), 0.5)
+
+    with pytest.warns(RuntimeWarning, match="did not converge"):
+        compute_currents(vv, xx, n_s, v_th, maxiter=1)
+
+
+def test_compute_power_max_not_converged():
+    """Test the warning if the search for the maximum power stops."""
+    my_fun = SolarCell()
+    n_s = my_fun.parameters["n_s"]
+    v_th = my_fun.parameters["v_th"]
+
+    xx = my_fun.prob_input.get_sample(10)
+
+    with pytest.warns(RuntimeWarning, match="maximum power"):
+        compute_power_max(xx, n_s, v_th, minimize={"maxiter": 1})
+
+
+def test_unknown_solver_parameters():
+    """Test that unsupported solver parameters are rejected."""
+    my_fun = SolarCell()
+    xx = my_fun.prob_input.get_sample(10)
+
+    my_fun.parameters.add("minimize", {"method": "Nelder-Mead"})
+    with pytest.raises(TypeError):
+        my_fun(xx)
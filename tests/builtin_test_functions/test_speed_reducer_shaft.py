@@ -0,0 +1,31 @@
+"""
+Test module for the speed reducer shaft test function.
+
+Notes
+-----
+- The tests defined in this module deals with
+  the correctness of the evaluation.
+"""
+
+import numpy as np
+
+from uqtestfuns import SpeedReducerShaft
+from uqtestfuns.test_functions import speed_reducer_shaft as shaft_mod
+
+
+def test_evaluate_out():
+    """Test evaluating the shaft model into a preallocated output array."""
+
+    # Create an instance of the speed reducer shaft model
+    my_fun = SpeedReducerShaft()
+
+    xx = my_fun.prob_input.get_sample(1000)
+    yy_ref = my_fun(xx)
+
+    # Evaluate into a preallocated array
+    out = np.empty(len(xx))
+    yy_test = shaft_mod.evaluate(xx, out=out)
+
+    # Assertions
+    assert yy_test is out
+    assert np.allclose(yy_test, yy_ref)
@@ -86,3 +86,21 @@ def test_compute_std():
 
     # Assertion
     assert np.allclose(std_mc, std_ref, rtol=1e-1)
+
+
+def test_evaluate_out():
+    """Test evaluating the Sulfur model into a preallocated output array."""
+
+    # Create an instance of Sulfur model
+    my_fun = Sulfur()
+
+    xx = my_fun.prob_input.get_sample(1000)
+    yy_ref = my_fun(xx)
+
+    # Evaluate into a preallocated array
+    out = np.empty(len(xx))
+    yy_test = sulfur_mod.evaluate(xx, out=out)
+
+    # Assertions
+    assert yy_test is out
+    assert np.allclose(yy_test, yy_ref)
@@ -13,15 +13,32 @@ import numpy as np
 import pytest
 import copy
 
-from typing import Type
+from typing import List, Type
 
 from conftest import assert_call
 
 from uqtestfuns.utils import get_available_classes
 from uqtestfuns import test_functions, UQTestFunABC
+from uqtestfuns.core.uqtestfun_abc import UQTestFunVarDimABC
 
 AVAILABLE_FUNCTION_CLASSES = get_available_classes(test_functions)
 
+# Test functions evaluated in single precision given single precision input
+SINGLE_PRECISION_CLASSES: List[Type[UQTestFunABC]] = [
+    test_functions.SobolG,
+    test_functions.SobolGStar,
+    test_functions.SobolLevitan,
+    test_functions.Welch1992,
+    test_functions.WingWeight,
+]
+
+# ...combined with each of their built-in parameter sets
+SINGLE_PRECISION_CASES = [
+    (testfun_class, parameters_id)
+    for testfun_class in SINGLE_PRECISION_CLASSES
+    for parameters_id in (testfun_class.available_parameters or [None])
+]
+
 
 @pytest.fixture(params=AVAILABLE_FUNCTION_CLASSES)
 def builtin_testfun(request) -> Type[UQTestFunABC]:
@@ -239,6 +256,12 @@ def test_evaluate_wrong_input_dim(builtin_testfun):
     with pytest.raises(ValueError):
         testfun(xx)
 
+    # One-dimensional array
+    xx = np.random.rand(testfun.input_dimension)
+
+    with pytest.raises(ValueError):
+        testfun(xx)
+
 
 def test_evaluate_wrong_input_domain(builtin_testfun):
     """Test if an exception is raised when sampled input is in wrong domain."""
@@ -276,3 +299,26 @@ def test_evaluate_invalid_input_selection(builtin_testfun):
     """Test if an exception is raised if invalid input selection is given."""
     with pytest.raises(KeyError):
         builtin_testfun(input_id=100)
+
+
+@pytest.mark.parametrize(
+    "testfun_class, parameters_id", SINGLE_PRECISION_CASES
+)
+def test_single_precision(testfun_class, parameters_id):
+    """Test that single precision input is evaluated in single precision."""
+    kwargs = {}
+    if parameters_id is not None:
+        kwargs["parameters_id"] = parameters_id
+    if issubclass(testfun_class, UQTestFunVarDimABC):
+        kwargs["input_dimension"] = 10
+    my_fun = testfun_class(**kwargs)
+
+    xx = my_fun.prob_input.get_sample(1000)
+    yy_ref = my_fun(xx)
+    yy_test = my_fun(xx.astype(np.float32))
+
+    # Assertions; the absolute tolerance is relative to the output magnitude
+    # as some outputs are differences of (much) larger terms
+    assert yy_test.dtype == np.float32
+    atol = 1e-5 * np.max(np.abs(yy_ref))
+    assert np.allclose(yy_test, yy_ref, rtol=1e-4, atol=atol)
@@ -0,0 +1,31 @@
+"""
+Test module for the wing weight test function.
+
+Notes
+-----
+- The tests defined in this module deals with
+  the correctness of the evaluation.
+"""
+
+import numpy as np
+
+from uqtestfuns.test_functions import WingWeight
+from uqtestfuns.test_functions import wing_weight as wing_weight_mod
+from uqtestfuns.test_functions.utils import BLOCK_SIZE
+
+
+def test_evaluate_out():
+    """Test evaluating the wing weight into a preallocated output array."""
+    my_fun = WingWeight()
+
+    # Span several blocks of rows
+    xx = my_fun.prob_input.get_sample(2 * BLOCK_SIZE + 10)
+    yy_ref = my_fun(xx)
+
+    # Evaluate into a preallocated array
+    out = np.empty(len(xx))
+    yy_test = wing_weight_mod.evaluate(xx, out=out)
+
+    # Assertions
+    assert yy_test is out
+    assert np.allclose(yy_test, yy_ref)